@@ -25,6 +25,10 @@ class XSDExStruct(BaseExStruct):
             source_path,
             result_path,
         )
+        # Base-type chains are shared by many elements; resolve each XSD type
+        # object once. Keyed by the type object itself so entries cannot
+        # collide across schemas parsed on the same instance
+        self._type_cache = {}
 
     def make_structure(
         self,
@@ -64,13 +68,16 @@ class XSDExStruct(BaseExStruct):
 
         self._parse_element_common_info(element, collected_info_settings)
 
+        element_type = element.type
+        has_simple_content = element_type.is_simple() or element_type.has_simple_content()
+
         collected_info_settings["type"] = (
-            self.data_type_mapping[self.get_data_type(element.type)]
-            if (element.type.is_simple() or element.type.has_simple_content())
+            self.data_type_mapping[self.get_data_type(element_type)]
+            if has_simple_content
             else "object"
         )
 
-        if element.type.is_simple() or element.type.has_simple_content():
+        if has_simple_content:
             result = self._parse_simple_element(element, collected_info_settings, ignore_levels)
         else:
             result = self._parse_complex_element(element, collected_info_settings, ignore_levels)
@@ -80,24 +87,22 @@ class XSDExStruct(BaseExStruct):
     def _parse_element_common_info(self, element, collected_info_settings):
         collected_info_settings["annotation"] = repr(str(element.annotation))
 
-        element_aliases = [
-            util.normalize_str(element.name),
-            util.normalize_str(element.local_name),
-            util.normalize_str(element.prefixed_name),
-            util.normalize_str(element.qualified_name),
-        ]
-
-        if element.type:
-            element_aliases.extend(
-                [
-                    util.normalize_str(element.type.name),
-                    util.normalize_str(element.type.local_name),
-                    util.normalize_str(element.type.prefixed_name),
-                    util.normalize_str(element.type.qualified_name),
-                ]
-            )
-
-        collected_info_settings["aliases"] = tuple(set(filter(None, element_aliases)))
+        # The 4-8 raw names are almost always 1-2 unique strings; dedup first
+        # so normalize_str runs once per unique name
+        raw_aliases = {}
+        for alias_owner in (element, element.type):
+            # Identity check: XsdElement defines __len__, so childless
+            # elements are falsy yet still carry their names
+            if alias_owner is None:
+                continue
+            for attribute in ("name", "local_name", "prefixed_name", "qualified_name"):
+                alias = getattr(alias_owner, attribute, None)
+                if alias:
+                    raw_aliases[alias] = None
+
+        collected_info_settings["aliases"] = tuple(
+            {util.normalize_str(alias): None for alias in raw_aliases}
+        )
 
         collected_info_settings["external_id"] = (
             True if element.local_name.lower() in self.external_id_collection else False
@@ -109,8 +114,9 @@ class XSDExStruct(BaseExStruct):
             collected_info_settings["collected_info_type"] = "V"
 
         try:
+            element_parent = element.parent
             collected_info_settings["occurence"] = bool(element.min_occurs) or not (
-                element.parent and (element.parent.model == "choice")
+                element_parent and (element_parent.model == "choice")
             )
         except AttributeError as err:
             collected_info_settings["occurence"] = True
@@ -140,7 +146,8 @@ class XSDExStruct(BaseExStruct):
         result["@collected_info"] = collected_info_settings
 
         # Проверка на бесконечную рекурсию
-        if element.parent and (element.type == element.parent.parent):
+        element_parent = element.parent
+        if element_parent and (element.type == element_parent.parent):
             return result
 
         for child in element.iterchildren():
@@ -156,6 +163,10 @@ class XSDExStruct(BaseExStruct):
         self,
         type: xmlschema.validators.XsdComplexType | xmlschema.validators.XsdElement,
     ):
-        if hasattr(type, "base_type") and type.base_type is not None:
-            return self.get_data_type(type.base_type)
-        return type.local_name
+        data_type = self._type_cache.get(type)
+        if data_type is None:
+            root_type = type
+            while hasattr(root_type, "base_type") and root_type.base_type is not None:
+                root_type = root_type.base_type
+            data_type = self._type_cache[type] = root_type.local_name
+        return data_type
@@ -1,11 +1,8 @@
 import os
-import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 
 import jinja2
-import more_itertools
-from deepdiff import grep
 from pkg_resources import resource_filename
 
 from .. import util
@@ -13,9 +10,29 @@ from .. import util
 DEFAULT_TEMPLATE = resource_filename(__name__, "templates/table_classes.py.jinja")
 
 
+def _make_environment(template_folder: Path) -> jinja2.Environment:
+    """Build the environment used for a template folder
+
+    Reloading and cache eviction are disabled: the template set is small and
+    static, so compiled templates should live for the whole process.
+    """
+    return jinja2.Environment(
+        loader=jinja2.loaders.FileSystemLoader(template_folder),
+        trim_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
 class ORMClassGenerator(object):
     """Handles generation of ORM classes with '.jinja' templates"""
 
+    # Environments and compiled templates survive across instances; rendering
+    # many schemas re-parses the template file otherwise
+    _env_cache = {}
+    _template_cache = {}
+
     _data_type_priorities = {
         "Integer": 1,
         "Boolean": 1,
@@ -35,20 +52,21 @@ class ORMClassGenerator(object):
         mapping_delimiter: str = " -> ",
         classes_save_location: Path = "./_generated_classes/",
     ) -> None:
-        template_path = Path(template_path)
-
         self._mapping = mapping
         self._schema = schema
-        self._template_path = Path(template_path)
+        self.template_path = template_path
         self._mapping_delimiter = mapping_delimiter
-        self._classes_save_location = Path(classes_save_location)
-
-        self._classes = defaultdict()
-        self._relationships = defaultdict()
-        self._foreign_keys = defaultdict()
-        self._tables_info = defaultdict()
-        self._assoc_tables_names = defaultdict()
-        self._external_ids = defaultdict()
+        self.classes_save_location = classes_save_location
+
+        self._classes = {}
+        self._relationships = {}
+        self._foreign_keys = {}
+        self._tables_info = {}
+        self._assoc_tables_names = {}
+        self._external_ids = {}
+        # Filled while columns are mapped so the external-id pass does not
+        # re-read every column's collected info
+        self._external_id_columns = defaultdict(list)
 
         self.logger = util.getLogger(f"{self.__module__}.{self.__class__.__name__}")
 
@@ -61,111 +79,147 @@ class ORMClassGenerator(object):
         content = {}
         content["table_schema"] = self.schema
         content["tables"] = self.classes
-        content["relationships"] = self.relationships
-        content["foreign_keys"] = self.foreign_keys
+        # Collected as sets; the template gets ordered lists
+        content["relationships"] = {
+            table_name: sorted(related_tables)
+            for table_name, related_tables in self.relationships.items()
+        }
+        content["foreign_keys"] = {
+            table_name: sorted(foreign_keys)
+            for table_name, foreign_keys in self.foreign_keys.items()
+        }
         content["assoc_tables_names"] = self.assoc_tables_names
         content["external_ids"] = self.external_ids
         content["tables_info"] = self.tables_info
 
-        rendered_classes = self.render(content)
-
-        return self.save_rendered_classes_to_file(rendered_classes)
+        return self.save_rendered_classes_to_file(content)
 
     def list_classes_to_generate(self, mapping: dict):
-        for data_type_name, data_type in mapping.items():
+        # Explicit worklist instead of one recursive call (and Python frame)
+        # per nested table; arbitrarily deep mappings no longer risk the
+        # recursion limit
+        stack = deque(mapping.items())
+        while stack:
+            data_type_name, data_type = stack.pop()
             self.classes.setdefault(data_type_name, {})
-            self.relationships.setdefault(data_type_name, [])
-            self.foreign_keys.setdefault(data_type_name, [])
-
-            data_type_elements = {child_key: data_type_child for child_key, data_type_child in data_type.items()}
-            data_type_collected_info = data_type_elements.pop("@collected_info")
-
-            data_type_elements_settings = {
-                element_key: data_type_elements[element_key]["@collected_info"] for element_key in data_type_elements
-            }
+            self.relationships.setdefault(data_type_name, set())
+            self.foreign_keys.setdefault(data_type_name, set())
 
-            self.tables_info[data_type_name] = data_type_collected_info
+            self.tables_info[data_type_name] = data_type["@collected_info"]
 
-            is_table = lambda key: data_type_elements_settings[key]["type"] == "object"
+            # One pass over the subtree, skipping the info sentinel in place
+            # instead of copying the dict without it
+            columns = {}
+            table_names = []
+            for element_key, element in data_type.items():
+                if element_key == "@collected_info":
+                    continue
+                if element["@collected_info"]["type"] == "object":
+                    table_names.append(element_key)
+                else:
+                    columns[element_key] = element
 
-            columns_names, table_names = more_itertools.partition(is_table, data_type_elements)
-            columns_names, table_names = tuple(columns_names), tuple(table_names)
+            self.__map_columns(columns)
 
-            self.__map_columns({column_name: data_type_elements[column_name] for column_name in columns_names})
+            stack.extend((child_table_name, data_type[child_table_name]) for child_table_name in table_names)
 
-            data_type_foreign_keys = []
-
-            for child_table_name in table_names:
-                data_type_foreign_keys.append(child_table_name)
-                self.list_classes_to_generate({child_table_name: data_type_elements[child_table_name]})
-
-            self.foreign_keys[data_type_name] = list(
-                set(self.foreign_keys[data_type_name]) | set(data_type_foreign_keys)
-            )
-
-            self.relationships[data_type_name] = list(set(self.relationships[data_type_name]) | set(table_names))
+            # In-place set updates instead of rebuilding a deduplicated list
+            # per visited table
+            self.foreign_keys[data_type_name].update(table_names)
+            self.relationships[data_type_name].update(table_names)
 
     def __map_columns(self, columns: dict):
+        mapping_delimiter = self.mapping_delimiter
+        data_type_priorities = self._data_type_priorities
+        classes = self.classes
         for _, column_settings in columns.items():
-            mapping = column_settings["@collected_info"]["mapping"]
-            # get element's parent name
-            column_table = mapping.split(self.mapping_delimiter)[-2]
-            column_name = mapping.split(self.mapping_delimiter)[-1]
-            if column_name not in self.classes[column_table]:
-                self.classes[column_table].update({column_name: column_settings})
+            collected_info = column_settings["@collected_info"]
+            # the mapping's last two segments are the element's parent and name
+            *_, column_table, column_name = collected_info["mapping"].rsplit(mapping_delimiter, 2)
+            table_columns = classes[column_table]
+            known_settings = table_columns.get(column_name)
+            if known_settings is None:
+                table_columns[column_name] = column_settings
+                if collected_info["external_id"]:
+                    self._external_id_columns[column_table].append(column_name)
             else:
-                old_type = self.classes[column_table][column_name]["@collected_info"]["type"]
-                new_type = column_settings["@collected_info"]["type"]
-                if self._data_type_priorities[new_type] > self._data_type_priorities[old_type]:
-                    self.classes[column_table][column_name]["@collected_info"]["type"] = new_type
+                known_info = known_settings["@collected_info"]
+                new_type = collected_info["type"]
+                if data_type_priorities[new_type] > data_type_priorities[known_info["type"]]:
+                    known_info["type"] = new_type
 
     def reflect_relationships(self):
-        for table_name in self.relationships:
-            related_tables = (self.relationships | grep(table_name, match_string=True, case_sensitive=True)).get(
-                "matched_values", []
-            )
-
-            for related_table_path in related_tables:
-                related_table_name = re.match(".*'(\S+)'.*", related_table_path)[1]
+        # One linear pass over the edges mirrors every parent->child relation
+        # back onto the child
+        reverse_index = defaultdict(set)
+        for table_name, related_tables in self.relationships.items():
+            for related_table_name in related_tables:
+                reverse_index[related_table_name].add(table_name)
 
-                if related_table_name not in self.relationships[table_name]:
-                    self.relationships[table_name].append(related_table_name)
-
-                if table_name not in self.relationships[related_table_name]:
-                    self.relationships[related_table_name].append(table_name)
+        for table_name, parent_tables in reverse_index.items():
+            self.relationships.setdefault(table_name, set()).update(parent_tables)
 
     def make_assoc_tables_names(self):
-        for table_name in self.foreign_keys:
-            for foreign_key in self.foreign_keys[table_name]:
-                assoc_table_name = f"at_{table_name}_{foreign_key}"
-                self.assoc_tables_names[(table_name, foreign_key)] = assoc_table_name[:63]
+        # PostgreSQL truncates identifiers at 63 *bytes*; slice the UTF-8
+        # encoding so non-ASCII names do not overshoot the limit
+        self._assoc_tables_names = {
+            (table_name, foreign_key): (
+                f"at_{table_name}_{foreign_key}".encode("utf-8")[:63].decode("utf-8", "ignore")
+            )
+            for table_name, foreign_keys in self.foreign_keys.items()
+            for foreign_key in foreign_keys
+        }
 
     def get_external_ids(self):
-        for table_name, table_content in self.classes.items():
-            external_ids_names = filter(
-                lambda item_name: table_content[item_name]["@collected_info"]["external_id"],
-                table_content,
-            )
-            self.external_ids[table_name] = tuple(external_ids_names)
+        external_id_columns = self._external_id_columns
+        for table_name in self.classes:
+            self.external_ids[table_name] = tuple(external_id_columns.get(table_name, ()))
 
     def render(self, content: dict):
-        loader = jinja2.loaders.FileSystemLoader(self.template_path.parent)
-        environment = jinja2.Environment(loader=loader, trim_blocks=True, keep_trailing_newline=True)
-        template = environment.get_or_select_template(self.template_path.name)
-        rendered_classes = template.render(content)
+        rendered_classes = self._get_template().render(content)
         return rendered_classes
 
-    def save_rendered_classes_to_file(self, rendered_classes: str, save_location: Path = None):
+    def render_to(self, content: dict, file):
+        """Stream rendered classes into an open file without building the string
+
+        Args:
+            content (dict): template rendering context
+            file: writable text file
+        """
+        self._get_template().stream(content).dump(file)
+
+    def _get_template(self):
+        template_folder = self.template_path.parent
+        template_name = self.template_path.name
+        environment = self._env_cache.get(template_folder)
+        if environment is None:
+            environment = self._env_cache.setdefault(
+                template_folder, _make_environment(template_folder)
+            )
+        template = self._template_cache.get((template_folder, template_name))
+        if template is None:
+            template = self._template_cache.setdefault(
+                (template_folder, template_name),
+                environment.get_or_select_template(template_name),
+            )
+        return template
+
+    def save_rendered_classes_to_file(self, content: dict, save_location: Path = None):
         if save_location:
             classes_save_location = save_location
         else:
             classes_save_location = self.classes_save_location
 
-        os.makedirs(classes_save_location, exist_ok=True)
-        open(classes_save_location.joinpath("__init__.py"), "a").close()
+        # Repeated generate() calls hit an existing package folder; skip the
+        # directory and __init__ syscalls once it is in place
+        if not classes_save_location.exists():
+            os.makedirs(classes_save_location)
+        init_filepath = classes_save_location.joinpath("__init__.py")
+        if not init_filepath.exists():
+            init_filepath.touch()
         classes_filepath = classes_save_location.joinpath(f"{self.schema}_generated_classes.py")
         with classes_filepath.open("w", encoding="utf-8") as classes_file:
-            classes_file.write(rendered_classes)
+            self.render_to(content, classes_file)
         return classes_filepath
 
     @property
@@ -202,7 +256,11 @@ class ORMClassGenerator(object):
 
     @template_path.setter
     def template_path(self, new_template_path: Path):
-        self._template_path = Path(new_template_path)
+        self._template_path = (
+            new_template_path
+            if isinstance(new_template_path, Path)
+            else Path(new_template_path)
+        )
 
     @template_path.deleter
     def template_path(self):
@@ -230,7 +288,11 @@ class ORMClassGenerator(object):
 
     @classes_save_location.setter
     def classes_save_location(self, new_save_location: Path):
-        self._classes_save_location = Path(new_save_location)
+        self._classes_save_location = (
+            new_save_location
+            if isinstance(new_save_location, Path)
+            else Path(new_save_location)
+        )
 
     @classes_save_location.deleter
     def classes_save_location(self):
@@ -259,3 +321,15 @@ class ORMClassGenerator(object):
     @property
     def assoc_tables_names(self):
         return self._assoc_tables_names
+
+
+# Compile the bundled template while the module loads; the first generate()
+# call then renders without paying the jinja2 parse cost
+_default_template_path = Path(DEFAULT_TEMPLATE)
+_default_environment = ORMClassGenerator._env_cache.setdefault(
+    _default_template_path.parent, _make_environment(_default_template_path.parent)
+)
+ORMClassGenerator._template_cache.setdefault(
+    (_default_template_path.parent, _default_template_path.name),
+    _default_environment.get_template(_default_template_path.name),
+)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import itertools
 import time
 import typing
@@ -10,11 +11,54 @@ import tenacity
 import requests
 import requests.auth
 import requests.exceptions
-from tenacity import retry
 
 from ..util import _util
 from ._base_parser import PARSER_BATCH_SIZE, BaseParser
 
+try:
+    # Optional speed-up: replace the default event loop with uvloop when the
+    # 'fast' extra is installed
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    uvloop.install()
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PARSER_CONCURRENCY = 8
+
+FORM_CONTENT_TYPE = {"Content-Type": "application/x-www-form-urlencoded"}
+
+_MISSING = object()
+
+
+_SHARED_CONNECTORS: dict = {}
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the process-wide TCP connector for the running event loop
+
+    Sharing one connector between parser instances makes connection-pool
+    limits apply globally and keeps the DNS cache warm across parsers.
+    """
+    loop = asyncio.get_running_loop()
+    connector = _SHARED_CONNECTORS.get(loop)
+    if connector is None or connector.closed:
+        for stale_loop in [known for known in _SHARED_CONNECTORS if known.is_closed()]:
+            del _SHARED_CONNECTORS[stale_loop]
+        connector = aiohttp.TCPConnector(limit=500, limit_per_host=100, ttl_dns_cache=600)
+        _SHARED_CONNECTORS[loop] = connector
+    return connector
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_urljoin(base: str, relative_url: str) -> str:
+    """Join `base` and `relative_url`, memoizing repeated pairs"""
+    if not relative_url:
+        return base
+    return urllib.parse.urljoin(base, relative_url)
+
 
 class APIParser(BaseParser):
     """Parser for data-sources that provide data via API (REST or another)"""
@@ -36,7 +80,19 @@ class APIParser(BaseParser):
         else:
             self.auth = None
 
+        self.stream = kwargs.pop("stream", False)
+        self._decode_response = {
+            "json": lambda response: response.json(),
+            "xml": lambda response: response.text,
+        }.get(response_type.lower(), self._read_bytes)
         self.retry_condition = kwargs.pop("retry_condition", API_retry_if_status_code())
+        self._retrier = tenacity.Retrying(
+            retry=self.retry_condition,
+            wait=tenacity.wait.wait_random_exponential(),
+            stop=tenacity.stop.stop_after_attempt(5),
+            after=tenacity.after.after_log(self.logger, _util.logging.WARNING),
+            reraise=True,
+        )
 
     def parse(self, method: str, request_params: dict = None, *args, **kwargs):
         """Parse data from API
@@ -51,12 +107,14 @@ class APIParser(BaseParser):
         Returns:
             Any: API response
         """
+        self.stream = kwargs.pop("stream", False)
+
         if request_params:
             payload = request_params
         else:
             payload = [request_params]
 
-        url = urllib.parse.urljoin(self.source, kwargs.pop("api_url", ""))
+        url = _cached_urljoin(self.source, kwargs.pop("api_url", ""))
         with requests.Session() as session:
             session.headers.update(kwargs.pop("headers", {}))
             session.auth = self.auth
@@ -88,6 +146,7 @@ class APIParser(BaseParser):
 
         KwArgs:
             break_time (float): pause between requests to API. Defaults to `0`.
+            stream (bool): read binary response bodies in chunks. Defaults to `False`.
             batch_size (int): batch size of request parameters to be processed at a time. Defaults to `10_000`
             api_url (str): relative url to API. Defaults to `''`.
             headers (dict): headers to be used during interaction with API. Defaults to `{}`.
@@ -96,6 +155,7 @@ class APIParser(BaseParser):
             list: list of request replies
         """
         self.break_time = kwargs.pop("break_time", 0)
+        self.stream = kwargs.pop("stream", False)
 
         # TODO Описать поведение, если получаемый массив параметров дохуя большой
         if requests_params:
@@ -104,16 +164,20 @@ class APIParser(BaseParser):
             requests_payloads = [requests_params]
 
         batch_size = kwargs.pop("batch_size", PARSER_BATCH_SIZE)
-        if not None in requests_payloads:
+        # Peek at the first payload instead of scanning (and exhausting) the
+        # whole iterable with a `None in ...` membership test
+        payloads_iterator = iter(requests_payloads)
+        first_payload = next(payloads_iterator, _MISSING)
+        if first_payload is _MISSING or first_payload is None:
+            payloads = [requests_payloads]
+        else:
             payloads = self.prepare_payloads(
-                requests_payloads,
+                itertools.chain((first_payload,), payloads_iterator),
                 use_params_product=use_params_product,
                 batch_size=batch_size,
             )
-        else:
-            payloads = [requests_payloads]
 
-        url = urllib.parse.urljoin(self.source, kwargs.pop("api_url", ""))
+        url = _cached_urljoin(self.source, kwargs.pop("api_url", ""))
 
         with requests.Session() as session:
             session.headers.update(kwargs.pop("headers", {}))
@@ -234,7 +298,11 @@ class APIParser(BaseParser):
         for batch in requests_batches:
             time.sleep(self.break_time)
             for payload in batch:
-                results.append(self.fetch(session, "post", url, data=payload))
+                # Encode the body once so retry attempts reuse it as-is
+                body = urllib.parse.urlencode(payload, doseq=True) if payload else None
+                results.append(
+                    self.fetch(session, "post", url, data=body, headers=FORM_CONTENT_TYPE)
+                )
         return results
 
     def post(
@@ -269,12 +337,9 @@ class APIParser(BaseParser):
             str|dict|bytes: request response
         """
 
-        @retry(
-            retry=self.retry_condition,
-            wait=tenacity.wait.wait_random_exponential(),
-            stop=tenacity.stop.stop_after_attempt(5),
-            after=tenacity.after.after_log(self.logger, _util.logging.WARNING),
-        )
+        if self.stream:
+            kwargs.setdefault("stream", True)
+
         def fetch_wrapper():
             with session.request(*args, **kwargs) as response:
                 if response.status_code == requests.codes.too_many:
@@ -290,16 +355,29 @@ class APIParser(BaseParser):
                     )
                     response.raise_for_status()
 
-                if self.response_type.lower() == "json":
-                    result = response.json()
-                elif self.response_type.lower() == "xml":
-                    result = response.text
-                else:
-                    result = response.content
+                result = self._decode_response(response)
 
             return result
 
-        return fetch_wrapper()
+        return self._retrier(fetch_wrapper)
+
+    def _read_bytes(self, response: requests.Response):
+        """Read a binary response body, chunked when streaming is enabled
+
+        Args:
+            response (requests.Response): response to read
+
+        Returns:
+            bytes: response body
+        """
+        if self.stream:
+            # Consume the body in chunks into one reusable buffer instead
+            # of letting `requests` accumulate a list of bytes objects
+            buffer = bytearray()
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                buffer += chunk
+            return bytes(buffer)
+        return response.content
 
 
 class AsyncAPIParser(APIParser):
@@ -322,7 +400,19 @@ class AsyncAPIParser(APIParser):
         else:
             self.auth = None
 
+        self.concurrency = kwargs.pop("concurrency", PARSER_CONCURRENCY)
+        self._decode_response = {
+            "json": lambda response: response.json(),
+            "xml": lambda response: response.text(),
+        }.get(response_type.lower(), self._read_bytes)
         self.retry_condition = kwargs.pop("retry_condition", API_retry_if_status_code())
+        self._retrier = tenacity.AsyncRetrying(
+            retry=self.retry_condition,
+            wait=tenacity.wait.wait_random_exponential(),
+            stop=tenacity.stop.stop_after_attempt(5),
+            after=tenacity.after.after_log(self.logger, _util.logging.WARNING),
+            reraise=True,
+        )
 
     def parse(self, method, request_params: dict = None, *args, **kwargs):
         """Parse data from API
@@ -337,6 +427,8 @@ class AsyncAPIParser(APIParser):
         Returns:
             Any: API response
         """
+        self.stream = kwargs.pop("stream", False)
+
         if request_params:
             payload = request_params
         else:
@@ -365,6 +457,7 @@ class AsyncAPIParser(APIParser):
 
         KwArgs:
             break_time (float): pause between requests to API. Defaults to `0`.
+            stream (bool): read binary response bodies in chunks. Defaults to `False`.
             batch_size (int): batch size of request parameters to be processed at a time. Defaults to `10_000`
             api_url (str): relative url to API. Defaults to `''`.
             headers (dict): headers to be used during interaction with API. Defaults to `{}`.
@@ -373,6 +466,7 @@ class AsyncAPIParser(APIParser):
             list: list of request replies
         """
         self.break_time = kwargs.pop("break_time", 0)
+        self.stream = kwargs.pop("stream", False)
 
         # TODO Описать поведение, если получаемый массив параметров дохуя большой
         if requests_params:
@@ -381,14 +475,18 @@ class AsyncAPIParser(APIParser):
             requests_payloads = [requests_params]
 
         batch_size = kwargs.pop("batch_size", PARSER_BATCH_SIZE)
-        if not None in requests_payloads:
+        # Peek at the first payload instead of scanning (and exhausting) the
+        # whole iterable with a `None in ...` membership test
+        payloads_iterator = iter(requests_payloads)
+        first_payload = next(payloads_iterator, _MISSING)
+        if first_payload is _MISSING or first_payload is None:
+            payloads = [requests_payloads]
+        else:
             payloads = self.prepare_payloads(
-                requests_payloads,
+                itertools.chain((first_payload,), payloads_iterator),
                 use_params_product=use_params_product,
                 batch_size=batch_size,
             )
-        else:
-            payloads = [requests_payloads]
 
         ioloop = asyncio.get_event_loop()
         recieved_data = ioloop.run_until_complete(
@@ -417,10 +515,14 @@ class AsyncAPIParser(APIParser):
         Returns:
             list: request response
         """
-        url = urllib.parse.urljoin(self.source, kwargs.pop("api_url", ""))
+        url = _cached_urljoin(self.source, kwargs.pop("api_url", ""))
 
         async with aiohttp.ClientSession(
-            headers=kwargs.pop("headers", None), trust_env=True, auth=self.auth
+            connector=_get_shared_connector(),
+            connector_owner=False,
+            headers=kwargs.pop("headers", None),
+            trust_env=True,
+            auth=self.auth,
         ) as session:
             recieved_data = []
 
@@ -453,10 +555,14 @@ class AsyncAPIParser(APIParser):
         Returns:
             list: list of requests responses
         """
-        url = urllib.parse.urljoin(self.source, kwargs.pop("api_url", ""))
+        url = _cached_urljoin(self.source, kwargs.pop("api_url", ""))
 
         async with aiohttp.ClientSession(
-            headers=kwargs.pop("headers", None), trust_env=True, auth=self.auth
+            connector=_get_shared_connector(),
+            connector_owner=False,
+            headers=kwargs.pop("headers", None),
+            trust_env=True,
+            auth=self.auth,
         ) as session:
             recieved_data = []
 
@@ -486,20 +592,17 @@ class AsyncAPIParser(APIParser):
         Returns:
             list: list of recieved responses
         """
-        recieved_data = []
-        for batch in requests_batches:
-            time.sleep(self.break_time)
-            for query_params in batch:
-                query = (
-                    urllib.parse.urlencode(query_params, doseq=True)
-                    if any(query_params)
-                    else None
-                )
-                recieved_data.append(
-                    await self.fetch(session, "get", url, params=query)
-                )
+        def prepare_request(query_params):
+            query = (
+                urllib.parse.urlencode(query_params, doseq=True)
+                if any(query_params)
+                else None
+            )
+            return {"params": query}
 
-        return recieved_data
+        return await self._dispatch_many(
+            session, "get", url, requests_batches, prepare_request
+        )
 
     async def get(
         self,
@@ -542,12 +645,75 @@ class AsyncAPIParser(APIParser):
         Returns:
             list: list of recieved responses
         """
-        results = []
-        for batch in requests_batches:
-            time.sleep(self.break_time)
-            for payload in batch:
-                results.append(await self.fetch(session, "post", url, data=payload))
-        return results
+        def prepare_request(payload):
+            # Encode the body once so retry attempts reuse it as-is
+            body = urllib.parse.urlencode(payload, doseq=True) if payload else None
+            return {"data": body, "headers": FORM_CONTENT_TYPE}
+
+        return await self._dispatch_many(
+            session, "post", url, requests_batches, prepare_request
+        )
+
+    async def _dispatch_many(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        requests_batches: typing.Iterable,
+        prepare_request: typing.Callable,
+    ):
+        """Pipeline payload preparation and request dispatch through a bounded queue
+
+        A producer coroutine prepares request parameters batch by batch while
+        `self.concurrency` workers issue the requests, so payload preparation
+        overlaps with network round-trips instead of running strictly before them.
+
+        Args:
+            session (aiohttp.ClientSession): session with data source
+            method (str): method used to make requests (`GET`, `POST`, etc.)
+            url (str): data source address
+            requests_batches (typing.Iterable): requests payloads
+            prepare_request (typing.Callable): maps one payload to request kwargs
+
+        Returns:
+            list: list of recieved responses in payload order
+        """
+        queue = asyncio.Queue(maxsize=2 * self.concurrency)
+        results = {}
+
+        async def producer():
+            request_number = 0
+            for batch in requests_batches:
+                await asyncio.sleep(self.break_time)
+                for payload in batch:
+                    await queue.put((request_number, prepare_request(payload)))
+                    request_number += 1
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def worker():
+            while (queued_request := await queue.get()) is not None:
+                request_number, request_kwargs = queued_request
+                results[request_number] = await self.fetch(
+                    session, method, url, **request_kwargs
+                )
+
+        tasks = [
+            asyncio.create_task(producer()),
+            *(asyncio.create_task(worker()) for _ in range(self.concurrency)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A fetch that exhausted its retries must not leave the producer
+            # and the remaining workers pending (or the producer blocked on a
+            # full queue); cancel them and wait before propagating
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [results[request_number] for request_number in sorted(results)]
 
     async def post(
         self,
@@ -581,12 +747,6 @@ class AsyncAPIParser(APIParser):
             str|dict: request response
         """
 
-        @retry(
-            retry=self.retry_condition,
-            wait=tenacity.wait.wait_random_exponential(),
-            stop=tenacity.stop.stop_after_attempt(5),
-            after=tenacity.after.after_log(self.logger, _util.logging.WARNING),
-        )
         async def fetch_wrapper():
             async with session.request(*args, **kwargs) as response:
                 if response.status == 429:
@@ -602,51 +762,65 @@ class AsyncAPIParser(APIParser):
                     )
                     response.raise_for_status()
 
-                if self.response_type.lower() == "json":
-                    result = await response.json()
-                elif self.response_type.lower() == "xml":
-                    result = await response.text()
-                else:
-                    result = await response.read()
+                result = await self._decode_response(response)
 
             return result
 
-        return await fetch_wrapper()
+        return await self._retrier(fetch_wrapper)
+
+    async def _read_bytes(self, response: aiohttp.ClientResponse):
+        """Read a binary response body, chunked when streaming is enabled
+
+        Args:
+            response (aiohttp.ClientResponse): response to read
+
+        Returns:
+            bytes: response body
+        """
+        if self.stream:
+            # Consume the body in chunks into one reusable buffer instead
+            # of materializing intermediate bytes objects in `read()`
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                buffer += chunk
+            return bytes(buffer)
+        return await response.read()
+
+
+def _exception_status_code(exception: BaseException | None) -> int | None:
+    """Extract the HTTP status code carried by a client exception
+
+    `requests` errors hold it on `.response.status_code`, `aiohttp`'s
+    `ClientResponseError` exposes it as `.status`; both parsers share the
+    retry predicates below.
+
+    Args:
+        exception (BaseException | None): exception raised by a fetch attempt
+
+    Returns:
+        int | None: status code, or None when the exception carries none
+    """
+    response = getattr(exception, "response", None)
+    if response is not None:
+        return getattr(response, "status_code", None)
+    return getattr(exception, "status", None)
 
 
 class API_retry_if_status_code(tenacity.retry_base):
-    def __init__(self, *status_codes: requests.structures.LookupDict) -> None:
+    def __init__(self, *status_codes: int) -> None:
         super().__init__()
-        self.status_codes = status_codes if status_codes else ()
+        self.status_codes = frozenset(int(code) for code in status_codes)
 
     def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
-        exception = retry_state.outcome.exception()
-        if issubclass(exception.__class__, Exception):
-            response = exception.response
-            if response:
-                status_code = response.get(status_code, 400)
-            else:
-                status_code = 400
-            if_retry = int(status_code) in self.status_codes
-        else:
-            if_retry = False
-        return if_retry
+        status_code = _exception_status_code(retry_state.outcome.exception())
+        return status_code is not None and status_code in self.status_codes
 
 
 class API_retry_if_not_status_code(tenacity.retry_base):
-    def __init__(self, *status_codes: requests.structures.LookupDict) -> None:
+    def __init__(self, *status_codes: int) -> None:
         super().__init__()
-        self.status_codes = status_codes if status_codes else ()
+        self.status_codes = frozenset(int(code) for code in status_codes)
 
     def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
-        exception = retry_state.outcome.exception()
-        if issubclass(exception.__class__, Exception):
-            response = exception.response
-            if response:
-                status_code = response.get(status_code, 400)
-            else:
-                status_code = 400
-            if_retry = int(status_code) not in self.status_codes
-        else:
-            if_retry = False
-        return if_retry
+        status_code = _exception_status_code(retry_state.outcome.exception())
+        return status_code is not None and status_code not in self.status_codes
@@ -1,9 +1,11 @@
+import functools
 import logging
 import logging.handlers
 import os
 from logging import Logger
 import keyword
 import string
+import transliterate
 from transliterate.contrib.languages.ru.translit_language_pack import RussianLanguagePack
 import transliterate.base
 transliterate.base.registry.register(RussianLanguagePack)
@@ -12,6 +14,44 @@ transliterate.base.registry.register(RussianLanguagePack)
 LOG_MESSAGE_FORMAT = "%(asctime)s - [%(levelname)s] - %(name)s - (%(filename)s).%(funcName)s(%(lineno)d) - %(message)s"
 LOG_DATETIME_FORMAT = "%d-%b-%y %H:%M:%S"
 
+# Built once: the translation table and the resolved language pack are the
+# expensive parts of to_var_name, and element names repeat across a schema
+_PUNCT_CHARS = f"{string.punctuation} №"
+_PUNCT_TRANS = str.maketrans(_PUNCT_CHARS, "_" * len(_PUNCT_CHARS))
+_translit_ru = transliterate.get_translit_function("ru")
+
+# Keywords and soft keywords that cannot be used as variable names
+_RESERVED_NAMES = frozenset(keyword.kwlist) | frozenset(keyword.softkwlist)
+
+# Every reversed-translit source in the Russian pack is a single character
+# (digraphs only appear on the output side), so the whole pack collapses into
+# one str.translate table built by probing the pack per character
+_RU_TRANS = {
+    ord(character): _translit_ru(character, reversed=True)
+    for character in (
+        RussianLanguagePack.mapping[1]
+        + RussianLanguagePack.reversed_specific_mapping[0]
+        + "".join(RussianLanguagePack.pre_processor_mapping.values())
+    )
+}
+
+
+_logging_configured = False
+
+
+def _configure_logging_once():
+    """Configure the root logger on the first getLogger call only"""
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        encoding="utf-8",
+        level=logging.INFO,
+        format=LOG_MESSAGE_FORMAT,
+        datefmt=LOG_DATETIME_FORMAT,
+    )
+    _logging_configured = True
+
 
 def getLogger(logger_name: str, logs_folder: str = None) -> Logger:
     """Make logger with rotating file handler
@@ -25,15 +65,16 @@ def getLogger(logger_name: str, logs_folder: str = None) -> Logger:
     """
     if not logs_folder:
         logs_folder = ".logs"
-    os.makedirs(".logs", exist_ok=True)
-    logging.basicConfig(
-        encoding="utf-8",
-        level=logging.INFO,
-        format=LOG_MESSAGE_FORMAT,
-        datefmt=LOG_DATETIME_FORMAT,
-        force=True,
-    )
     logger = logging.getLogger(f"{logger_name}")
+    if any(
+        isinstance(handler, logging.handlers.RotatingFileHandler)
+        for handler in logger.handlers
+    ):
+        # Already set up: repeated calls used to stack duplicate handlers,
+        # multiplying the work done per emitted record
+        return logger
+    os.makedirs(".logs", exist_ok=True)
+    _configure_logging_once()
     logger.setLevel(logging.INFO)
     logger_formatter = logging.Formatter(
         fmt=LOG_MESSAGE_FORMAT,
@@ -50,6 +91,7 @@ def getLogger(logger_name: str, logs_folder: str = None) -> Logger:
     return logger
 
 
+@functools.lru_cache(maxsize=4096)
 def to_var_name(modified_string: str):
     """Translate given string to viable python variable name
 
@@ -59,19 +101,11 @@ def to_var_name(modified_string: str):
     Returns:
         str: string, meeting python variables naming rules
     """
-    result = transliterate.translit(modified_string, "ru", reversed=True)
+    result = modified_string.translate(_RU_TRANS)
     if modified_string:
-        result = result.translate(
-            str.maketrans(
-                f"{string.punctuation} №", "__________________________________"
-            )
-        )
-
-    if (
-        keyword.iskeyword(result)
-        or keyword.issoftkeyword(result)
-        or modified_string[0].isdigit()
-    ):
+        result = result.translate(_PUNCT_TRANS)
+
+    if result in _RESERVED_NAMES or modified_string[0].isdigit():
         result = f"_{result}"
 
     return result
@@ -87,9 +121,8 @@ def normalize_str(string: str):
     Returns:
         str: normalized string
     """
-    result = string
-    if string:
-        # Add space before and in-between triple-quote in string to prevent false triple-quote termination
-        result = ' "" "'.join(result.rsplit('"""'))
+    if not string or '"""' not in string:
+        return string
 
-    return result
+    # Add space before and in-between triple-quote in string to prevent false triple-quote termination
+    return ' "" "'.join(string.rsplit('"""'))